@@ -3,15 +3,1008 @@ Interactive Linear Algebra Visualization Script
 Allows users to input their own constants and visualize linear algebra concepts
 """
 
+import array
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from matplotlib.collections import LineCollection
+from mpl_toolkits.mplot3d import Axes3D, proj3d
+
+try:
+    import numba
+except ImportError:  # Numba is optional; the JIT backend is skipped without it
+    numba = None
+
+
+# Determinants at or below this magnitude are treated as singular
+SINGULAR_TOL = 1e-10
+
+# Upper edges of the batch-size buckets used for backend selection
+BATCH_BUCKETS = (1, 16, 256, 4096)
+
+# Vector dimensions each kernel is tuned for
+KERNEL_DIMS = {
+    'solve': (2,),
+    'cross': (3,),
+    'dot': (2, 3),
+    'transform': (2, 3),
+    'det': (2, 3),
+}
+
+KERNELS = tuple(KERNEL_DIMS)
+
+
+def batch_bucket(n):
+    """Return the batch-size bucket that a batch of n elements falls into"""
+    for edge in BATCH_BUCKETS:
+        if n <= edge:
+            return edge
+    return BATCH_BUCKETS[-1]
+
+
+def bucket_label(bucket):
+    """Human-readable batch-size range covered by a bucket"""
+    if bucket == BATCH_BUCKETS[-1]:
+        return f"N>{BATCH_BUCKETS[-2]}"
+    return f"N<={bucket}"
+
+
+def _is_single(x, depth):
+    """Whether x is one element nested depth levels deep rather than a batch"""
+    if type(x) is np.ndarray:
+        return x.ndim == depth
+    first = x[0][0] if depth == 2 else x[0]
+    return not isinstance(first, (list, tuple, np.ndarray))
+
+
+class Backend:
+    """Base for compute backends
+
+    Subclasses implement the batched kernels. The single-element *_one entry
+    points default to running a batch of one and may be overridden with
+    something cheaper. Whichever backend runs them, *_one results are float
+    ndarrays for vectors and Python floats for scalars, so callers can do
+    arithmetic on them regardless of the autotune's picks.
+    """
+    name = None
+
+    def solve_one(self, A, b):
+        """Solve one 2x2 system; returns (det, solution)"""
+        det, sols = self.solve(np.asarray(A, dtype=float)[None], np.asarray(b, dtype=float)[None])
+        return float(det[0]), sols[0]
+
+    def cross_one(self, u, v):
+        """Cross product of two 3D vectors"""
+        return self.cross(np.asarray(u, dtype=float)[None], np.asarray(v, dtype=float)[None])[0]
+
+    def dot_one(self, u, v):
+        """Dot product of two vectors"""
+        return float(self.dot(np.asarray(u, dtype=float)[None], np.asarray(v, dtype=float)[None])[0])
+
+    def transform_one(self, vector, matrix):
+        """Apply matrix to a single vector"""
+        return self.transform(np.asarray(vector, dtype=float)[None], np.asarray(matrix, dtype=float))[0]
+
+    def det_one(self, matrix):
+        """Determinant of a single square matrix"""
+        return float(self.det(np.asarray(matrix, dtype=float)[None])[0])
+
+
+class PythonBackend(Backend):
+    """Scalar Python kernels, cheapest for a single element"""
+    name = 'python'
+
+    def solve_one(self, A, b):
+        """Solve one 2x2 system with Cramer's rule on Python floats"""
+        (a1, b1), (a2, b2) = A
+        c1, c2 = b
+        det = a1*b2 - a2*b1
+        if abs(det) > SINGULAR_TOL:
+            return float(det), np.array(((c1*b2 - c2*b1) / det, (a1*c2 - a2*c1) / det))
+        return float(det), np.array((math.nan, math.nan))
+
+    def cross_one(self, u, v):
+        """Cross product of two 3D vectors"""
+        u1, u2, u3 = u
+        v1, v2, v3 = v
+        return np.array((u2*v3 - u3*v2, u3*v1 - u1*v3, u1*v2 - u2*v1), dtype=float)
+
+    def dot_one(self, u, v):
+        """Dot product of two vectors"""
+        return float(sum(p*q for p, q in zip(u, v)))
+
+    def transform_one(self, vector, matrix):
+        """Apply matrix to a single vector"""
+        return np.array([sum(m*x for m, x in zip(row, vector)) for row in matrix], dtype=float)
+
+    def det_one(self, matrix):
+        """Determinant of a square matrix, closed form for 2x2 and 3x3"""
+        if len(matrix) == 2:
+            (a, b), (c, d) = matrix
+            return float(a*d - b*c)
+        if len(matrix) == 3:
+            (a, b, c), (d, e, f), (g, h, i) = matrix
+            return float(a*(e*i - f*h) - b*(d*i - f*g) + c*(d*h - e*g))
+        return float(np.linalg.det(np.asarray(matrix, dtype=float)))
+
+    def solve(self, A, b):
+        """Solve batched 2x2 systems A @ x = b with Cramer's rule"""
+        results = [self.solve_one(Ai, bi) for Ai, bi in zip(A.tolist(), b.tolist())]
+        return np.array([r[0] for r in results]), np.array([r[1] for r in results])
+
+    def cross(self, u, v):
+        """Batched 3D cross product"""
+        return np.array([self.cross_one(ui, vi) for ui, vi in zip(u.tolist(), v.tolist())])
+
+    def dot(self, u, v):
+        """Batched dot product"""
+        return np.array([self.dot_one(ui, vi) for ui, vi in zip(u.tolist(), v.tolist())])
+
+    def transform(self, vectors, matrix):
+        """Apply matrix to every row of vectors"""
+        rows = matrix.tolist()
+        return np.array([self.transform_one(v, rows) for v in vectors.tolist()])
+
+    def det(self, matrices):
+        """Batched determinant, closed form for 2x2 and 3x3 and NumPy otherwise"""
+        if matrices.shape[-1] not in (2, 3):
+            return np.linalg.det(matrices)
+        return np.array([self.det_one(m) for m in matrices.tolist()])
+
+
+class NumpyBackend(Backend):
+    """Vectorized NumPy kernels, cheapest for large batches"""
+    name = 'numpy'
+
+    def cross_one(self, u, v):
+        """Cross product of two 3D vectors"""
+        return np.cross(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+
+    def dot_one(self, u, v):
+        """Dot product of two vectors"""
+        return float(np.dot(u, v))
+
+    def transform_one(self, vector, matrix):
+        """Apply matrix to a single vector"""
+        return np.asarray(matrix, dtype=float) @ np.asarray(vector, dtype=float)
+
+    def det_one(self, matrix):
+        """Determinant of a single square matrix"""
+        return float(np.linalg.det(matrix))
+
+    def solve(self, A, b):
+        """Solve batched 2x2 systems A @ x = b with Cramer's rule"""
+        a1, b1 = A[:, 0, 0], A[:, 0, 1]
+        a2, b2 = A[:, 1, 0], A[:, 1, 1]
+        c1, c2 = b[:, 0], b[:, 1]
+        det = a1*b2 - a2*b1
+        ok = np.abs(det) > SINGULAR_TOL
+        safe = np.where(ok, det, 1.0)
+        sols = np.stack([(c1*b2 - c2*b1) / safe, (a1*c2 - a2*c1) / safe], axis=-1)
+        sols[~ok] = np.nan
+        return det, sols
+
+    def cross(self, u, v):
+        """Batched 3D cross product"""
+        return np.cross(u, v)
+
+    def dot(self, u, v):
+        """Batched dot product"""
+        return np.einsum('ij,ij->i', u, v)
+
+    def transform(self, vectors, matrix):
+        """Apply matrix to every row of vectors"""
+        return vectors @ matrix.T
+
+    def det(self, matrices):
+        """Batched determinant of square matrices"""
+        return np.linalg.det(matrices)
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _numba_solve(A, b):
+        n = A.shape[0]
+        dets = np.empty(n)
+        sols = np.empty((n, 2))
+        for k in range(n):
+            a1, b1, a2, b2 = A[k, 0, 0], A[k, 0, 1], A[k, 1, 0], A[k, 1, 1]
+            c1, c2 = b[k, 0], b[k, 1]
+            det = a1*b2 - a2*b1
+            dets[k] = det
+            if abs(det) > SINGULAR_TOL:
+                sols[k, 0] = (c1*b2 - c2*b1) / det
+                sols[k, 1] = (a1*c2 - a2*c1) / det
+            else:
+                sols[k, 0] = np.nan
+                sols[k, 1] = np.nan
+        return dets, sols
+
+    @numba.njit(cache=True)
+    def _numba_cross(u, v):
+        out = np.empty_like(u)
+        for k in range(u.shape[0]):
+            out[k, 0] = u[k, 1]*v[k, 2] - u[k, 2]*v[k, 1]
+            out[k, 1] = u[k, 2]*v[k, 0] - u[k, 0]*v[k, 2]
+            out[k, 2] = u[k, 0]*v[k, 1] - u[k, 1]*v[k, 0]
+        return out
+
+    @numba.njit(cache=True)
+    def _numba_dot(u, v):
+        out = np.zeros(u.shape[0])
+        for k in range(u.shape[0]):
+            for j in range(u.shape[1]):
+                out[k] += u[k, j]*v[k, j]
+        return out
+
+    @numba.njit(cache=True)
+    def _numba_transform(vectors, matrix):
+        n, d = vectors.shape
+        out = np.zeros((n, matrix.shape[0]))
+        for k in range(n):
+            for i in range(matrix.shape[0]):
+                for j in range(d):
+                    out[k, i] += matrix[i, j]*vectors[k, j]
+        return out
+
+    @numba.njit(cache=True)
+    def _numba_det(matrices):
+        n = matrices.shape[0]
+        out = np.empty(n)
+        if matrices.shape[1] == 2:
+            for k in range(n):
+                m = matrices[k]
+                out[k] = m[0, 0]*m[1, 1] - m[0, 1]*m[1, 0]
+        else:
+            for k in range(n):
+                m = matrices[k]
+                out[k] = (m[0, 0]*(m[1, 1]*m[2, 2] - m[1, 2]*m[2, 1])
+                          - m[0, 1]*(m[1, 0]*m[2, 2] - m[1, 2]*m[2, 0])
+                          + m[0, 2]*(m[1, 0]*m[2, 1] - m[1, 1]*m[2, 0]))
+        return out
+
+
+class NumbaBackend(Backend):
+    """JIT-compiled loop kernels, only available when Numba is installed"""
+    name = 'numba'
+
+    def solve(self, A, b):
+        """Solve batched 2x2 systems A @ x = b with Cramer's rule"""
+        return _numba_solve(np.ascontiguousarray(A, dtype=np.float64),
+                            np.ascontiguousarray(b, dtype=np.float64))
+
+    def cross(self, u, v):
+        """Batched 3D cross product"""
+        return _numba_cross(np.ascontiguousarray(u, dtype=np.float64),
+                            np.ascontiguousarray(v, dtype=np.float64))
+
+    def dot(self, u, v):
+        """Batched dot product"""
+        return _numba_dot(np.ascontiguousarray(u, dtype=np.float64),
+                          np.ascontiguousarray(v, dtype=np.float64))
+
+    def transform(self, vectors, matrix):
+        """Apply matrix to every row of vectors"""
+        return _numba_transform(np.ascontiguousarray(vectors, dtype=np.float64),
+                                np.ascontiguousarray(matrix, dtype=np.float64))
+
+    def det(self, matrices):
+        """Batched determinant, JIT loops for 2x2 and 3x3 and NumPy otherwise"""
+        if matrices.shape[-1] not in (2, 3):
+            return np.linalg.det(matrices)
+        return _numba_det(np.ascontiguousarray(matrices, dtype=np.float64))
+
+
+def available_backends():
+    """Return an instance of every compute backend usable in this environment"""
+    backends = [PythonBackend(), NumpyBackend()]
+    if numba is not None:
+        backends.append(NumbaBackend())
+    return backends
+
+
+def _sample_arguments(rng, kernel, dim, n):
+    """Random arguments for a batch of n dim-sized inputs, used for autotuning"""
+    if kernel == 'solve':
+        return rng.standard_normal((n, 2, 2)), rng.standard_normal((n, 2))
+    if kernel in ('cross', 'dot'):
+        return rng.standard_normal((n, dim)), rng.standard_normal((n, dim))
+    if kernel == 'transform':
+        return rng.standard_normal((n, dim)), rng.standard_normal((dim, dim))
+    return (rng.standard_normal((n, dim, dim)),)
+
+
+def _single_arguments(kernel, args):
+    """First element of a sample batch as plain Python lists, as callers pass it"""
+    if kernel == 'transform':
+        return args[0][0].tolist(), args[1].tolist()
+    return tuple(a[0].tolist() for a in args)
+
+
+def _best_time(fn, args, repeats, inner, cutoff=float('inf')):
+    """Best per-call wall time of fn(*args) over several timed runs
+
+    Stops early once a run is slower than cutoff, so clearly losing backends
+    do not stretch the startup autotune.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(inner):
+            fn(*args)
+        best = min(best, (time.perf_counter() - start) / inner)
+        if best > cutoff:
+            break
+    return best
+
+
+class ComputeDispatcher:
+    """Routes each kernel call to the fastest backend for its size and batch size"""
+
+    def __init__(self, backends=None):
+        self.backends = backends if backends is not None else available_backends()
+        self.default = next((b for b in self.backends if b.name == 'numpy'), self.backends[0])
+        self.choices = {}
+        self.usage = {}
+
+    def autotune(self, repeats=3):
+        """Time every backend on each kernel, dimension and batch bucket and keep the fastest"""
+        rng = np.random.default_rng(0)
+        # Warm up every kernel once, which also triggers JIT compilation
+        for kernel, dims in KERNEL_DIMS.items():
+            for dim in dims:
+                args = _sample_arguments(rng, kernel, dim, 1)
+                for backend in self.backends:
+                    getattr(backend, kernel)(*args)
+                    getattr(backend, kernel + '_one')(*_single_arguments(kernel, args))
+
+        # Time the default backend first so slower ones can bail out early
+        ordered = [self.default] + [b for b in self.backends if b is not self.default]
+        for kernel, dims in KERNEL_DIMS.items():
+            for dim in dims:
+                for bucket in BATCH_BUCKETS:
+                    args = _sample_arguments(rng, kernel, dim, bucket)
+                    if bucket == 1:
+                        # Single elements go through the *_one entry points
+                        args, suffix = _single_arguments(kernel, args), '_one'
+                    else:
+                        suffix = ''
+                    inner = max(1, 256 // bucket)
+                    best, choice = float('inf'), self.default
+                    for backend in ordered:
+                        fn = getattr(backend, kernel + suffix)
+                        elapsed = _best_time(fn, args, repeats, inner, cutoff=2 * best)
+                        if elapsed < best:
+                            best, choice = elapsed, backend
+                    self.choices[(kernel, dim, bucket)] = choice
+
+    def _backend(self, kernel, dim, n):
+        bucket = batch_bucket(n)
+        backend = self.choices.get((kernel, dim, bucket), self.default)
+        key = (kernel, dim, bucket, backend.name)
+        self.usage[key] = self.usage.get(key, 0) + 1
+        return backend
+
+    def _backend_one(self, kernel, dim):
+        # Same as _backend(kernel, dim, 1) without the bucket search, for the per-element path
+        backend = self.choices.get((kernel, dim, 1), self.default)
+        key = (kernel, dim, 1, backend.name)
+        self.usage[key] = self.usage.get(key, 0) + 1
+        return backend
+
+    def solve(self, A, b):
+        """Solve 2x2 system(s) A @ x = b; returns (det, solution), NaN where singular"""
+        if _is_single(A, 2):
+            return self._backend_one('solve', 2).solve_one(A, b)
+        A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float)
+        return self._backend('solve', 2, len(A)).solve(A, b)
+
+    def cross(self, u, v):
+        """3D cross product of single vectors or row-wise over batches"""
+        if _is_single(u, 1):
+            return self._backend_one('cross', 3).cross_one(u, v)
+        u = np.asarray(u, dtype=float)
+        v = np.asarray(v, dtype=float)
+        return self._backend('cross', 3, len(u)).cross(u, v)
+
+    def dot(self, u, v):
+        """Dot product of single vectors or row-wise over batches"""
+        if _is_single(u, 1):
+            return self._backend_one('dot', len(u)).dot_one(u, v)
+        u = np.asarray(u, dtype=float)
+        v = np.asarray(v, dtype=float)
+        return self._backend('dot', u.shape[1], len(u)).dot(u, v)
+
+    def transform(self, vectors, matrix):
+        """Apply matrix to a single vector or to every row of a batch"""
+        if _is_single(vectors, 1):
+            return self._backend_one('transform', len(vectors)).transform_one(vectors, matrix)
+        vectors = np.asarray(vectors, dtype=float)
+        matrix = np.asarray(matrix, dtype=float)
+        return self._backend('transform', vectors.shape[1], len(vectors)).transform(vectors, matrix)
+
+    def det(self, matrices):
+        """Determinant of a single matrix or of each matrix in a batch"""
+        if _is_single(matrices, 2):
+            return self._backend_one('det', len(matrices)).det_one(matrices)
+        matrices = np.asarray(matrices, dtype=float)
+        return self._backend('det', matrices.shape[-1], len(matrices)).det(matrices)
+
+    def selection_report(self):
+        """Lines describing the backend picked for each kernel, dimension and batch bucket"""
+        lines = [f"Compute backends available: {', '.join(b.name for b in self.backends)}"]
+        for kernel, dims in KERNEL_DIMS.items():
+            for dim in dims:
+                picks = ', '.join(
+                    f"{bucket_label(bucket)}: {self.choices.get((kernel, dim, bucket), self.default).name}"
+                    for bucket in BATCH_BUCKETS)
+                lines.append(f"  {kernel:<10} {dim}D  {picks}")
+        return lines
+
+    def usage_report(self):
+        """Lines counting how many calls each backend handled per kernel and bucket"""
+        if not self.usage:
+            return ["No compute kernels were called."]
+        lines = ["Compute kernel usage (kernel, dimension, batch bucket, backend: calls):"]
+        for (kernel, dim, bucket, name), calls in sorted(self.usage.items()):
+            lines.append(f"  {kernel:<10} {dim}D  {bucket_label(bucket):<8} {name:<7} {calls}")
+        return lines
+
+
+# Target size in bytes of each row chunk read from a dataset while streaming
+CHUNK_BYTES = 64 << 20
+
+# Maximum number of dataset rows drawn in a projection scatter plot
+MAX_PLOT_POINTS = 5000
+
+
+def default_chunk_rows(n_cols):
+    """Number of float64 rows of width n_cols that fit in one streaming chunk"""
+    return max(1, CHUNK_BYTES // (8 * n_cols))
+
+
+def load_dataset(path):
+    """Memory-map an N x D matrix stored as a .npy file without reading it into RAM"""
+    data = np.load(path, mmap_mode='r')
+    if not isinstance(data, np.ndarray):
+        # .npz archives load as an NpzFile and pickles as arbitrary objects
+        if hasattr(data, 'close'):
+            data.close()
+        raise ValueError(f"Expected a single array saved with numpy.save, got {type(data).__name__}")
+    if data.ndim != 2:
+        raise ValueError(f"Expected a 2D N x D matrix, got an array of shape {data.shape}")
+    if data.shape[0] < 2 or data.shape[1] < 3:
+        raise ValueError(f"Need at least 2 rows and 3 columns to project to 3D, got {data.shape}")
+    return data
+
+
+def _gram_product(data, Q, chunk_rows, shift):
+    """Stream Y^T (Y Q), the column sums and the column sums of squares of Y = X - shift
+
+    Accumulating around a shift close to the mean keeps the sums small, so
+    removing the mean afterwards does not cancel away precision when the
+    columns have a large offset relative to their spread.
+    """
+    gram = np.zeros((data.shape[1], Q.shape[1]))
+    total = np.zeros(data.shape[1])
+    total_sq = np.zeros(data.shape[1])
+    for start in range(0, data.shape[0], chunk_rows):
+        chunk = np.asarray(data[start:start + chunk_rows], dtype=np.float64) - shift
+        gram += chunk.T @ (chunk @ Q)
+        total += chunk.sum(axis=0)
+        total_sq += np.einsum('ij,ij->j', chunk, chunk)
+    return gram, total, total_sq
+
+
+def randomized_pca(data, n_components=3, oversample=10, n_iter=2, chunk_rows=None, seed=0):
+    """Top principal axes of an N x D matrix via a streaming randomized range finder
+
+    Each pass reads the data once in row chunks and applies the centered
+    covariance to a D x (n_components + oversample) block, so memory stays
+    bounded by one chunk plus a few D-sized blocks. The full covariance is
+    never formed. Returns (mean, axes, variances, total_variance) where axes
+    is D x n_components.
+    """
+    n, d = data.shape
+    chunk_rows = chunk_rows or default_chunk_rows(d)
+    rank = min(d, n_components + oversample)
+    rng = np.random.default_rng(seed)
+
+    Q = rng.standard_normal((d, rank))
+    # The first row is a cheap stand-in for the mean until the first pass has run
+    mean = np.asarray(data[0], dtype=np.float64)
+    for _ in range(n_iter + 1):
+        Q, _ = np.linalg.qr(Q)
+        gram, total, total_sq = _gram_product(data, Q, chunk_rows, mean)
+        residual = total / n
+        # Centered covariance times Q, using X_c^T X_c = Y^T Y - n * r r^T for
+        # Y = X - shift with column means r
+        covQ = (gram - n * np.outer(residual, residual @ Q)) / (n - 1)
+        total_variance = (total_sq - n * residual**2).sum() / (n - 1)
+        mean = mean + residual
+        previous, Q = Q, covQ
+
+    # Rayleigh-Ritz on the subspace spanned by the last orthonormal block
+    eigvals, eigvecs = np.linalg.eigh(previous.T @ covQ)
+    order = np.argsort(eigvals)[::-1][:n_components]
+    axes = previous @ eigvecs[:, order]
+    # Fix the sign so the largest-magnitude component of each axis is positive
+    signs = np.sign(axes[np.argmax(np.abs(axes), axis=0), np.arange(axes.shape[1])])
+    axes *= np.where(signs == 0, 1, signs)
+    return mean, axes, eigvals[order], total_variance
+
+
+def project_dataset(data, mean, axes, chunk_rows=None, out=None):
+    """Project rows of data onto the principal axes chunk by chunk
+
+    out may be a preallocated (or memory-mapped) N x n_components array.
+    """
+    chunk_rows = chunk_rows or default_chunk_rows(data.shape[1])
+    if out is None:
+        out = np.empty((data.shape[0], axes.shape[1]))
+    for start in range(0, data.shape[0], chunk_rows):
+        chunk = np.asarray(data[start:start + chunk_rows], dtype=np.float64)
+        out[start:start + chunk_rows] = (chunk - mean) @ axes
+    return out
+
+
+# Side length of the square blocks of line pairs evaluated at once. Each
+# 256 x 256 float64 temporary is 512 KB and a tile holds several at once
+# (det, x, y, products and masks), a few MB in total, so a tile fits a typical
+# L3 cache. Smaller tiles measured slower as per-call NumPy overhead grows.
+INTERSECTION_TILE = 256
+
+
+def load_lines(path):
+    """Load N lines ax + by = c as an N x 3 array of (a, b, c) from .npy or text"""
+    if path.endswith('.npy'):
+        lines = np.load(path)
+    else:
+        lines = np.loadtxt(path, delimiter=',' if path.endswith('.csv') else None, ndmin=2)
+    lines = np.asarray(lines, dtype=np.float64)
+    if lines.ndim != 2 or lines.shape[1] != 3:
+        raise ValueError(f"Expected an N x 3 array of (a, b, c) rows, got shape {lines.shape}")
+    degenerate = (lines[:, 0] == 0) & (lines[:, 1] == 0)
+    if degenerate.any():
+        raise ValueError(f"Line {np.argmax(degenerate)} has both coefficients a and b equal to zero")
+    return lines
+
+
+def edge_tolerance(bounds):
+    """Slack for treating points within rounding error of the viewport edge as on it"""
+    x_min, x_max, y_min, y_max = bounds
+    return 1e-9 * max(x_max - x_min, y_max - y_min)
+
+
+def in_bounds(x, y, bounds):
+    """Mask of points inside bounds, edges included up to edge_tolerance"""
+    x_min, x_max, y_min, y_max = bounds
+    tol = edge_tolerance(bounds)
+    return (x >= x_min - tol) & (x <= x_max + tol) & (y >= y_min - tol) & (y <= y_max + tol)
+
+
+def _intersect_tile(lines, i0, i1, j0, j1, bounds):
+    """Intersections between lines[i0:i1] and lines[j0:j1], filtered to bounds
+
+    Cramer's rule is broadcast across the two tile edges here rather than run
+    through the solve kernel. That kernel would need every pair gathered
+    into a (tile * tile, 2, 2) array first, and the tile's temporaries
+    would no longer fit in cache.
+    """
+    a_i, b_i, c_i = (col[:, None] for col in lines[i0:i1].T)
+    a_j, b_j, c_j = lines[j0:j1].T
+
+    det = a_i*b_j - a_j*b_i
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = (c_i*b_j - c_j*b_i) / det
+        y = (a_i*c_j - a_j*c_i) / det
+
+    mask = np.abs(det) > SINGULAR_TOL
+    if i0 == j0:
+        # Diagonal tile: keep each unordered pair once
+        mask &= np.arange(i1 - i0)[:, None] < np.arange(j1 - j0)[None, :]
+    if bounds is not None:
+        mask &= in_bounds(x, y, bounds)
+
+    ii, jj = np.nonzero(mask)
+    points = np.column_stack([x[ii, jj], y[ii, jj]])
+    pairs = np.column_stack([ii + i0, jj + j0]).astype(np.int32)
+    return points, pairs
+
+
+def pairwise_intersections(lines, bounds=None, tile=INTERSECTION_TILE, workers=None):
+    """Every pairwise intersection of N lines, optionally limited to a viewport
+
+    The N^2 pairs are evaluated in tile x tile blocks so temporaries stay
+    cache sized, and blocks run on a thread pool since NumPy releases the GIL.
+    bounds is (x_min, x_max, y_min, y_max) and includes its edges; without
+    it every intersection in the plane is returned, which grows as N^2.
+    Returns (points, pairs) where pairs[k] holds the indices i < j of the
+    lines meeting at points[k].
+    """
+    n = len(lines)
+    blocks = [(i0, min(i0 + tile, n), j0, min(j0 + tile, n))
+              for i0 in range(0, n, tile) for j0 in range(i0, n, tile)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(blocks) == 1:
+        results = [_intersect_tile(lines, *block, bounds) for block in blocks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda block: _intersect_tile(lines, *block, bounds), blocks))
+
+    if not results:
+        return np.empty((0, 2)), np.empty((0, 2), dtype=np.int32)
+    return (np.concatenate([r[0] for r in results]),
+            np.concatenate([r[1] for r in results]))
+
+
+def clip_lines(lines, bounds):
+    """Clip lines to the viewport rectangle
+
+    Returns (visible, start, end): a mask of lines that cross or touch the
+    viewport and the two boundary points of each visible line's chord.
+    """
+    x_min, x_max, y_min, y_max = bounds
+    a, b, c = lines.T
+    norm_sq = a*a + b*b
+    # Closest point to the origin on each line and a direction along it
+    origin = np.column_stack([a*c, b*c]) / norm_sq[:, None]
+    direction = np.column_stack([-b, a])
+
+    t_low = np.full(len(lines), -np.inf)
+    t_high = np.full(len(lines), np.inf)
+    for axis, (lo, hi) in enumerate([(x_min, x_max), (y_min, y_max)]):
+        p, d = origin[:, axis], direction[:, axis]
+        moving = d != 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_lo = (lo - p) / d
+            t_hi = (hi - p) / d
+        inside = (p >= lo) & (p <= hi)
+        t_low = np.maximum(t_low, np.where(moving, np.minimum(t_lo, t_hi), np.where(inside, -np.inf, np.inf)))
+        t_high = np.minimum(t_high, np.where(moving, np.maximum(t_lo, t_hi), np.where(inside, np.inf, -np.inf)))
+
+    # Lines through a corner give a zero-length chord; keep them like the edges
+    visible = t_low <= t_high + edge_tolerance(bounds) / np.sqrt(norm_sq)
+    t_high = np.maximum(t_low, t_high)
+    start = origin[visible] + t_low[visible, None] * direction[visible]
+    end = origin[visible] + t_high[visible, None] * direction[visible]
+    return visible, start, end
+
+
+def _perimeter_position(points, bounds):
+    """Counterclockwise distance along the viewport boundary from (x_min, y_min)"""
+    x_min, x_max, y_min, y_max = bounds
+    width, height = x_max - x_min, y_max - y_min
+    x, y = points[:, 0], points[:, 1]
+    distances = np.column_stack([np.abs(y - y_min), np.abs(x - x_max),
+                                 np.abs(y - y_max), np.abs(x - x_min)])
+    positions = np.column_stack([x - x_min,
+                                 width + (y - y_min),
+                                 width + height + (x_max - x),
+                                 2*width + height + (y_max - y)])
+    positions = positions[np.arange(len(points)), np.argmin(distances, axis=1)]
+    # The boundary is a loop: the bottom-left corner is both 0 and the full perimeter
+    positions[positions >= 2 * (width + height) - edge_tolerance(bounds)] = 0.0
+    return positions
+
+
+def viewport_intersections(lines, bounds, compute=None):
+    """Pairwise intersections inside the viewport using a boundary sweep
+
+    Each line crossing the viewport becomes a chord with two endpoints on the
+    boundary. Two chords meet inside the viewport, edges included, exactly
+    when their endpoints interleave around the boundary or coincide. So
+    sweeping chords by their first endpoint only solves the pairs that
+    actually intersect in view, and lines that miss the viewport are dropped
+    up front. The solves go through compute (a ComputeDispatcher) when
+    given. Returns (points, pairs) like pairwise_intersections.
+    """
+    visible, start, end = clip_lines(lines, bounds)
+    index = np.nonzero(visible)[0]
+    s = _perimeter_position(start, bounds)
+    e = _perimeter_position(end, bounds)
+    s, e = np.minimum(s, e), np.maximum(s, e)
+    tol = edge_tolerance(bounds)
+
+    order = np.argsort(s, kind='stable')
+    index, s, e = index[order], s[order], e[order]
+    # Chords starting no later than chord k ends are the only candidates
+    stops = np.searchsorted(s, e + tol, side='right')
+
+    first, second = [], []
+    for k in range(len(index)):
+        candidates = np.arange(k + 1, stops[k])
+        # Interleaving (or a shared end) crosses; a chord nested inside k does not
+        meets = (e[candidates] >= e[k] - tol) | (s[candidates] <= s[k] + tol)
+        crossing = candidates[meets]
+        if len(crossing):
+            first.append(np.full(len(crossing), index[k]))
+            second.append(index[crossing])
+
+    if not first:
+        return np.empty((0, 2)), np.empty((0, 2), dtype=np.int32)
+    i = np.concatenate(first)
+    j = np.concatenate(second)
+    pairs = np.column_stack([np.minimum(i, j), np.maximum(i, j)]).astype(np.int32)
+
+    pair_lines = lines[pairs]
+    solve = compute.solve if compute is not None else NumpyBackend().solve
+    _, points = solve(pair_lines[:, :, :2], pair_lines[:, :, 2])
+    # Parallel or identical lines can share a chord end but have no single
+    # crossing, and nearly parallel chords whose ends touch within the
+    # tolerance can cross far outside, so keep only solved points in view
+    with np.errstate(invalid='ignore'):
+        solved = in_bounds(points[:, 0], points[:, 1], bounds)
+    return points[solved], pairs[solved]
+
+
+class GridIndex:
+    """Uniform grid over 2D points for nearest-neighbour lookups
+
+    Points are bucketed by cell in one vectorized pass. The bucketed
+    coordinates are then stored in flat typed arrays, so a single lookup
+    avoids NumPy's per-call overhead and only touches the few cells around
+    the query. A cell holding more than CELL_CAPACITY points, as in a tight
+    cluster, gets a nested grid of its own instead of a linear scan.
+    """
+
+    # Cells with more points than this are indexed by a nested grid
+    CELL_CAPACITY = 32
+    # Nesting depth after which dense cells are scanned linearly
+    MAX_DEPTH = 4
+
+    def __init__(self, points, cell_size=None, _depth=0):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.size = len(points)
+        if self.size == 0:
+            return
+
+        lo = points.min(axis=0)
+        span = points.max(axis=0) - lo
+        if cell_size is None:
+            # Aim for about one point per cell without exceeding ~N cells
+            area = span[0] * span[1]
+            cell_size = np.sqrt(area / self.size) if area > 0 else span.max() / self.size
+            cell_size = max(cell_size, span.max() / self.size) or 1.0
+            cells = ((points - lo) // cell_size).astype(np.int64)
+            occupied = np.count_nonzero(np.bincount(cells[:, 1] * (cells[:, 0].max() + 1) + cells[:, 0]))
+            if occupied < self.size / 4:
+                # Clustered points leave most cells empty. Size the cells for the
+                # sparse regions instead, since dense cells get nested grids
+                cell_size *= min(np.sqrt(self.size / occupied), np.sqrt(self.CELL_CAPACITY))
+            else:
+                # Match the density of the occupied cells
+                cell_size *= np.sqrt(occupied / self.size)
+        self.cell_size = float(cell_size)
+        self.x0, self.y0 = float(lo[0]), float(lo[1])
+
+        cells = ((points - lo) // self.cell_size).astype(np.int64)
+        self.nx = int(cells[:, 0].max()) + 1
+        self.ny = int(cells[:, 1].max()) + 1
+        cell_ids = cells[:, 1] * self.nx + cells[:, 0]
+        order = np.argsort(cell_ids, kind='stable')
+        counts = np.bincount(cell_ids, minlength=self.nx * self.ny)
+
+        # Dense cells move into nested grids, kept per row as
+        # (column, grid, ids, bounding box of the grid's points)
+        self._dense_rows = {}
+        if _depth < self.MAX_DEPTH:
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+            sparse = np.ones(self.size, dtype=bool)
+            for cell in np.nonzero(counts > self.CELL_CAPACITY)[0]:
+                members = order[offsets[cell]:offsets[cell + 1]]
+                inner = points[members]
+                if not np.ptp(inner, axis=0).any():
+                    # All points coincide, so any one of them is as near as the rest
+                    members, inner = members[:1], inner[:1]
+                row, col = divmod(int(cell), self.nx)
+                (x_min, y_min), (x_max, y_max) = inner.min(axis=0), inner.max(axis=0)
+                self._dense_rows.setdefault(row, []).append(
+                    (col, GridIndex(inner, _depth=_depth + 1), array.array('q', members.astype(np.int64).tobytes()),
+                     (float(x_min), float(x_max), float(y_min), float(y_max))))
+                sparse[offsets[cell]:offsets[cell + 1]] = False
+                counts[cell] = 0
+            order = order[sparse]
+
+        self._starts = array.array('q', np.concatenate([[0], np.cumsum(counts)]).astype(np.int64).tobytes())
+        self._ids = array.array('q', order.astype(np.int64).tobytes())
+        self._xs = array.array('d', np.ascontiguousarray(points[order, 0]).tobytes())
+        self._ys = array.array('d', np.ascontiguousarray(points[order, 1]).tobytes())
+
+    def nearest(self, x, y, max_dist=float('inf')):
+        """Index of the point nearest to (x, y) within max_dist, or None"""
+        if self.size == 0:
+            return None
+        return self._nearest(x, y, max_dist * max_dist)[0]
+
+    def _nearest(self, x, y, best_d2):
+        """(index, squared distance) of the nearest point closer than sqrt(best_d2)"""
+        cs = self.cell_size
+        nx, ny = self.nx, self.ny
+        starts, ids, xs, ys = self._starts, self._ids, self._xs, self._ys
+        dense_rows = self._dense_rows
+        gx = (x - self.x0) / cs
+        gy = (y - self.y0) / cs
+        cx, cy = math.floor(gx), math.floor(gy)
+        # Distance, in cells, from the query to the nearest edge of its cell
+        edge = min(gx - cx, cx + 1 - gx, gy - cy, cy + 1 - gy)
+        best = None
+
+        # A dense query cell most likely holds the answer, so search it first
+        # to tighten the bound before its neighbours are visited
+        seeded = None
+        if dense_rows and cy in dense_rows:
+            for i, grid, members, _ in dense_rows[cy]:
+                if i == cx:
+                    seeded = grid
+                    hit, best_d2 = grid._nearest(x, y, best_d2)
+                    if hit is not None:
+                        best = members[hit]
+
+        # Skip rings that do not touch the grid, stop after the outermost one
+        first_ring = max(0, -cx, cx - (nx - 1), -cy, cy - (ny - 1))
+        last_ring = max(cx, nx - 1 - cx, cy, ny - 1 - cy)
+        r = first_ring
+        while r <= last_ring:
+            if r <= 1:
+                # Rings 0 and 1 together: the 3 x 3 block around the query cell
+                i0, i1 = max(cx - 1, 0), min(cx + 1, nx - 1)
+                segments = [(j, i0, i1) for j in range(max(cy - 1, 0), min(cy + 1, ny - 1) + 1)]
+                r = 1
+            else:
+                # Every point in ring r is at least this far from the query
+                bound = (r - 1 + edge) * cs
+                if bound * bound >= best_d2:
+                    break
+                # Cells are stored row-major, so a clipped row of the ring is one slice
+                i0, i1 = max(cx - r, 0), min(cx + r, nx - 1)
+                segments = [(j, i0, i1) for j in (cy - r, cy + r) if 0 <= j < ny]
+                for i in (cx - r, cx + r):
+                    if 0 <= i < nx:
+                        segments.extend((j, i, i) for j in range(max(cy - r + 1, 0), min(cy + r - 1, ny - 1) + 1))
+            for j, i0, i1 in segments:
+                if i1 - i0 > 4:
+                    # Long rows (far queries, skinny grids): scan the columns nearest the
+                    # query first, then each side only as far as the best distance allows
+                    c = min(max(cx, i0 + 2), i1 - 2)
+                    parts = ((c - 2, c + 2), (i0, c - 3), (c + 3, i1))
+                else:
+                    parts = ((i0, i1),)
+                for p0, p1 in parts:
+                    if p0 > i0 or p1 < i1:
+                        gap = max(self.y0 + j * cs - y, y - self.y0 - (j + 1) * cs, 0.0)
+                        reach = best_d2 - gap * gap
+                        if reach <= 0:
+                            break
+                        if reach < math.inf:
+                            reach = math.sqrt(reach)
+                            p0 = max(p0, math.floor((x - reach - self.x0) / cs))
+                            p1 = min(p1, math.floor((x + reach - self.x0) / cs))
+                        if p0 > p1:
+                            continue
+                    for k in range(starts[j * nx + p0], starts[j * nx + p1 + 1]):
+                        dx = xs[k] - x
+                        dy = ys[k] - y
+                        d2 = dx*dx + dy*dy
+                        if d2 < best_d2:
+                            best, best_d2 = ids[k], d2
+                    if dense_rows and j in dense_rows:
+                        for i, grid, members, (x_min, x_max, y_min, y_max) in dense_rows[j]:
+                            if p0 <= i <= p1 and grid is not seeded:
+                                dx = max(x_min - x, x - x_max, 0.0)
+                                dy = max(y_min - y, y - y_max, 0.0)
+                                if dx*dx + dy*dy >= best_d2:
+                                    continue
+                                hit, d2 = grid._nearest(x, y, best_d2)
+                                if hit is not None:
+                                    best, best_d2 = members[hit], d2
+            r += 1
+
+        return best, best_d2
+
+
+class HoverTooltip:
+    """Tooltip showing the nearest plotted element under the mouse
+
+    The grid index is built over the elements' screen positions. Redraws
+    only mark it stale; it is rebuilt on the next hover or click, and only
+    if the view changed (zoom, pan, resize or 3D rotation), so dragging a
+    3D view does not rebuild it every frame.
+    Clicking an element also prints its description to the console.
+    """
+
+    def __init__(self, ax, points, describe, radius=15):
+        self.ax = ax
+        self.points = np.asarray(points, dtype=np.float64)
+        self.describe = describe
+        self.radius = radius
+        self.index = None
+        self._view = None
+        self._stale = True
+
+        self.annotation = ax.annotate('', xy=(0, 0), xycoords='figure pixels',
+                                      xytext=(12, 12), textcoords='offset points',
+                                      bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.9),
+                                      fontsize=9, visible=False)
+        self.annotation.set_in_layout(False)
+
+        canvas = ax.figure.canvas
+        canvas.mpl_connect('draw_event', self._on_draw)
+        canvas.mpl_connect('motion_notify_event', self._on_move)
+        canvas.mpl_connect('button_press_event', self._on_click)
+
+    def _current_view(self):
+        view = self.ax.transData.get_affine().get_matrix().tobytes()
+        if self.points.shape[1] == 3:
+            view += self.ax.get_proj().tobytes()
+        return view
+
+    def _rebuild(self):
+        self._stale = False
+        view = self._current_view()
+        if view == self._view:
+            return
+        xy = self.points
+        if xy.shape[1] == 3:
+            x, y, _ = proj3d.proj_transform(xy[:, 0], xy[:, 1], xy[:, 2], self.ax.get_proj())
+            xy = np.column_stack([x, y])
+        xy = self.ax.transData.transform(xy)
+        # Only elements inside the axes (plus the pick radius) can be hovered
+        x0, y0, x1, y1 = self.ax.bbox.extents
+        inside = ((xy[:, 0] >= x0 - self.radius) & (xy[:, 0] <= x1 + self.radius) &
+                  (xy[:, 1] >= y0 - self.radius) & (xy[:, 1] <= y1 + self.radius))
+        self._visible = np.nonzero(inside)[0]
+        self.index = GridIndex(xy[inside])
+        self._view = view
+
+    def _on_draw(self, event):
+        self._stale = True
+
+    def _lookup(self, event):
+        if event.inaxes is not self.ax:
+            return None
+        if self._stale:
+            self._rebuild()
+        hit = self.index.nearest(event.x, event.y, self.radius)
+        return None if hit is None else int(self._visible[hit])
+
+    def _on_move(self, event):
+        # No lookups while dragging (pan, zoom box or 3D rotation)
+        hit = None if event.button is not None else self._lookup(event)
+        if hit is None:
+            if self.annotation.get_visible():
+                self.annotation.set_visible(False)
+                self.ax.figure.canvas.draw_idle()
+            return
+        self.annotation.xy = (event.x, event.y)
+        self.annotation.set_text(self.describe(hit))
+        self.annotation.set_visible(True)
+        self.ax.figure.canvas.draw_idle()
+
+    def _on_click(self, event):
+        hit = self._lookup(event)
+        if hit is not None:
+            print("\n" + self.describe(hit))
 
 
 class LinearAlgebraVisualizer:
     def __init__(self):
         self.dimension = None
         self.visualization_type = None
+        self.compute = ComputeDispatcher()
+        self.tooltips = []
+
+    def _add_tooltip(self, ax, points, describe):
+        """Attach a hover tooltip to ax, keeping it alive while its figure is open"""
+        # Matplotlib only holds weak references to the callbacks
+        self.tooltips = [t for t in self.tooltips if plt.fignum_exists(t.ax.figure.number)]
+        self.tooltips.append(HoverTooltip(ax, points, describe))
 
     def get_dimension_choice(self):
         """Ask user to choose between 2D or 3D"""
@@ -44,6 +1037,7 @@ class LinearAlgebraVisualizer:
                 print("2. Linear Equation (line)")
                 print("3. System of Linear Equations (2 lines)")
                 print("4. Linear Transformation (matrix)")
+                print("5. All-pairs Line Intersections (file of lines)")
                 print("0. Back to main menu")
             else:  # 3D
                 print("Choose visualization type:")
@@ -51,12 +1045,14 @@ class LinearAlgebraVisualizer:
                 print("2. Plane (single plane)")
                 print("3. System of Planes (2 planes)")
                 print("4. Linear Transformation (matrix)")
+                print("5. Dataset Projection (PCA of .npy file)")
                 print("0. Back to main menu")
             print("=" * 50)
 
-            choice = input("\nEnter your choice (0-4): ").strip()
+            options = ['0', '1', '2', '3', '4', '5']
+            choice = input(f"\nEnter your choice (0-{options[-1]}): ").strip()
 
-            if choice in ['0', '1', '2', '3', '4']:
+            if choice in options:
                 return choice
             else:
                 print("Invalid choice. Please try again.")
@@ -245,14 +1241,12 @@ class LinearAlgebraVisualizer:
                     ax.axvline(x=x_val, color='r', linewidth=2, label=f'{a2}x = {c2}')
 
                 # Solve for intersection using Cramer's rule
-                det = a1*b2 - a2*b1
+                det, (x_sol, y_sol) = self.compute.solve([[a1, b1], [a2, b2]], [c1, c2])
 
-                if abs(det) > 1e-10:  # Lines intersect at one point
-                    x_sol = (c1*b2 - c2*b1) / det
-                    y_sol = (a1*c2 - a2*c1) / det
+                if abs(det) > SINGULAR_TOL:  # Lines intersect at one point
                     ax.plot(x_sol, y_sol, 'go', markersize=12, label=f'Solution ({x_sol:.2f}, {y_sol:.2f})')
                     print(f"\nSolution: x = {x_sol:.4f}, y = {y_sol:.4f}")
-                elif abs(a1*b2 - a2*b1) < 1e-10 and abs(a1*c2 - a2*c1) < 1e-10:
+                elif abs(a1*c2 - a2*c1) < SINGULAR_TOL:
                     print("\nInfinite solutions (same line)")
                 else:
                     print("\nNo solution (parallel lines)")
@@ -305,13 +1299,14 @@ class LinearAlgebraVisualizer:
 
                 # Original vectors (basis vectors and a sample vector)
                 vectors = np.array([[1, 0], [0, 1], [1, 1]])
-                transformed = vectors @ transform.T
+                transformed = self.compute.transform(vectors, transform)
 
                 # Create plot
                 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
 
                 colors = ['r', 'g', 'b']
                 labels = ['i (1,0)', 'j (0,1)', '(1,1)']
+                transformed_labels = ["i'", "j'", "(1,1)'"]
 
                 # Original vectors
                 for i, v in enumerate(vectors):
@@ -327,11 +1322,10 @@ class LinearAlgebraVisualizer:
                 ax1.set_xlabel('x')
                 ax1.set_ylabel('y')
 
-                # Transformed vectors
+                # Transformed vectors; their coordinates are shown by the hover tooltip
                 for i, v in enumerate(transformed):
                     ax2.quiver(0, 0, v[0], v[1], angles='xy', scale_units='xy', scale=1,
-                              color=colors[i], width=0.008,
-                              label=f"({v[0]:.2f}, {v[1]:.2f})")
+                              color=colors[i], width=0.008, label=transformed_labels[i])
 
                 max_val = max(np.max(np.abs(transformed)) + 1, 3)
                 ax2.set_xlim(-max_val, max_val)
@@ -340,6 +1334,14 @@ class LinearAlgebraVisualizer:
                 ax2.grid(True, alpha=0.3)
                 ax2.legend()
                 ax2.set_title(f'After Transformation\n[[{a}, {b}], [{c}, {d}]]')
+
+                def describe_2d(i, vectors=vectors, transformed=transformed, names=transformed_labels):
+                    x, y = transformed[i]
+                    return (f"{names[i]} = ({x:.4f}, {y:.4f})\n"
+                            f"|v| = {np.hypot(x, y):.4f}, angle = {np.degrees(np.arctan2(y, x)):.2f}°\n"
+                            f"from ({vectors[i][0]}, {vectors[i][1]})")
+
+                self._add_tooltip(ax2, transformed, describe_2d)
                 ax2.set_xlabel('x')
                 ax2.set_ylabel('y')
 
@@ -348,7 +1350,7 @@ class LinearAlgebraVisualizer:
                 plt.pause(0.1)
 
                 # Calculate determinant
-                det = a*d - b*c
+                det = self.compute.det(transform)
                 print(f"\nDeterminant: {det:.4f}")
                 print(f"Area scaling factor: {abs(det):.4f}")
 
@@ -366,6 +1368,116 @@ class LinearAlgebraVisualizer:
                 break
             plt.close()
 
+    def visualize_2d_line_intersections(self):
+        """All pairwise intersections of many lines loaded from a file"""
+        bounds = (-10, 10, -10, 10)
+        while True:
+            print("\n" + "=" * 50)
+            print("All-pairs Line Intersections")
+            print("File rows: a, b, c for each line ax + by = c")
+            print("=" * 50)
+
+            path = input("\nEnter path to .npy, .csv or .txt file (blank to go back): ").strip()
+            if not path:
+                break
+
+            try:
+                lines = load_lines(path)
+                method = input("Method:\n1. Blocked all-pairs (viewport only)\n"
+                               "2. Sweep-line (viewport only)\n"
+                               "3. Blocked all-pairs, whole plane (memory grows as N^2)\nChoice: ").strip()
+
+                n = len(lines)
+                start = time.perf_counter()
+                if method == '2':
+                    points, pairs = viewport_intersections(lines, bounds, self.compute)
+                elif method == '3':
+                    points, pairs = pairwise_intersections(lines)
+                else:
+                    points, pairs = pairwise_intersections(lines, bounds)
+                elapsed = time.perf_counter() - start
+
+                visible, chord_start, chord_end = clip_lines(lines, bounds)
+                if method == '2':
+                    print(f"\n{n} lines, {np.count_nonzero(visible)} crossing the viewport, "
+                          f"swept in {elapsed:.2f}s")
+                else:
+                    print(f"\n{n} lines, {n*(n - 1)//2} pairs checked in {elapsed:.2f}s")
+
+                if method == '3':
+                    in_view = in_bounds(points[:, 0], points[:, 1], bounds)
+                    print(f"Intersections found: {len(points)} "
+                          f"({np.count_nonzero(in_view)} inside the viewport)")
+                    shown = np.nonzero(in_view)[0]
+                else:
+                    print(f"Intersections inside the viewport: {len(points)}")
+                    shown = np.arange(len(points))
+                in_view_count = len(shown)
+
+                # Create plot
+                fig, ax = plt.subplots(figsize=(10, 10))
+
+                ax.add_collection(LineCollection(np.stack([chord_start, chord_end], axis=1),
+                                                 colors='b', linewidths=0.5, alpha=0.3,
+                                                 label=f'{np.count_nonzero(visible)} lines in view'))
+
+                # Only a random sample of intersections is drawn
+                if len(shown) > MAX_PLOT_POINTS:
+                    shown = np.random.default_rng(0).choice(shown, size=MAX_PLOT_POINTS, replace=False)
+                ax.scatter(points[shown, 0], points[shown, 1], s=4, color='r',
+                           label=f'{len(shown)} of {in_view_count} intersections')
+
+                ax.axhline(y=0, color='k', linewidth=0.5)
+                ax.axvline(x=0, color='k', linewidth=0.5)
+                ax.grid(True, alpha=0.3)
+                ax.set_xlim(bounds[0], bounds[1])
+                ax.set_ylim(bounds[2], bounds[3])
+                ax.set_aspect('equal')
+                ax.legend(fontsize=10)
+                ax.set_title('All-pairs Line Intersections', fontsize=14)
+
+                def describe_intersection(k, shown=shown):
+                    x, y = points[shown[k]]
+                    i, j = pairs[shown[k]]
+                    (a1, b1, c1), (a2, b2, c2) = lines[i], lines[j]
+                    return (f"({x:.4f}, {y:.4f})\n"
+                            f"line {i}: {a1:.3g}x + {b1:.3g}y = {c1:.3g}\n"
+                            f"line {j}: {a2:.3g}x + {b2:.3g}y = {c2:.3g}")
+
+                self._add_tooltip(ax, points[shown], describe_intersection)
+                ax.set_xlabel('x')
+                ax.set_ylabel('y')
+
+                plt.tight_layout()
+                plt.show(block=False)
+                plt.pause(0.1)
+
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+                continue
+
+            choice = input("\nOptions:\n1. Load another file\n2. Save image\n"
+                           "3. Save intersections (.npy)\n0. Back to menu\nChoice: ").strip()
+            if choice == '2':
+                filename = input("Enter filename (without extension): ").strip()
+                plt.savefig(f"{filename}.png", dpi=300, bbox_inches='tight')
+                print(f"Saved as {filename}.png")
+            elif choice == '3':
+                filename = input("Enter filename (without extension): ").strip()
+                # Columns: x, y, index of first line, index of second line. Written
+                # through a memory map so no combined copy is built in RAM
+                out = np.lib.format.open_memmap(f"{filename}.npy", mode='w+',
+                                                dtype=np.float64, shape=(len(points), 4))
+                out[:, :2] = points
+                out[:, 2:] = pairs
+                out.flush()
+                del out
+                print(f"Saved as {filename}.npy")
+            elif choice != '1':
+                plt.close()
+                break
+            plt.close()
+
     def visualize_3d_vectors(self):
         """Interactive 3D vector visualization"""
         while True:
@@ -387,7 +1499,7 @@ class LinearAlgebraVisualizer:
                 v1 = np.array([v1_x, v1_y, v1_z])
                 v2 = np.array([v2_x, v2_y, v2_z])
                 v_sum = v1 + v2
-                v_cross = np.cross(v1, v2)
+                v_cross = self.compute.cross(v1, v2)
 
                 # Create plot
                 fig = plt.figure(figsize=(14, 6))
@@ -439,7 +1551,7 @@ class LinearAlgebraVisualizer:
                 plt.pause(0.1)
 
                 # Print dot product
-                dot_product = np.dot(v1, v2)
+                dot_product = self.compute.dot(v1, v2)
                 print(f"\nDot product: {dot_product:.4f}")
                 print(f"Cross product magnitude: {np.linalg.norm(v_cross):.4f}")
 
@@ -602,6 +1714,12 @@ class LinearAlgebraVisualizer:
                 break
             plt.close()
 
+    def _draw_3d_vectors(self, ax, vectors, colors, labels):
+        """Draw vectors as arrows from the origin on a 3D axis"""
+        for v, color, label in zip(vectors, colors, labels):
+            ax.quiver(0, 0, 0, v[0], v[1], v[2], color=color,
+                      arrow_length_ratio=0.15, linewidth=2, label=label)
+
     def visualize_3d_transformation(self):
         """Interactive 3D linear transformation"""
         while True:
@@ -632,7 +1750,7 @@ class LinearAlgebraVisualizer:
 
                 # Original basis vectors
                 vectors = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
-                transformed = vectors @ transform.T
+                transformed = self.compute.transform(vectors, transform)
 
                 # Create plot
                 fig = plt.figure(figsize=(14, 6))
@@ -642,9 +1760,7 @@ class LinearAlgebraVisualizer:
 
                 # Original vectors
                 ax1 = fig.add_subplot(121, projection='3d')
-                for i, v in enumerate(vectors):
-                    ax1.quiver(0, 0, 0, v[0], v[1], v[2], color=colors[i],
-                              arrow_length_ratio=0.15, linewidth=2, label=labels[i])
+                self._draw_3d_vectors(ax1, vectors, colors, labels)
 
                 ax1.set_xlim([0, 2])
                 ax1.set_ylim([0, 2])
@@ -657,10 +1773,8 @@ class LinearAlgebraVisualizer:
 
                 # Transformed vectors
                 ax2 = fig.add_subplot(122, projection='3d')
-                for i, v in enumerate(transformed):
-                    ax2.quiver(0, 0, 0, v[0], v[1], v[2], color=colors[i],
-                              arrow_length_ratio=0.15, linewidth=2,
-                              label=f"{labels[i]}' = ({v[0]:.2f}, {v[1]:.2f}, {v[2]:.2f})")
+                # Their coordinates are shown by the hover tooltip
+                self._draw_3d_vectors(ax2, transformed, colors, [f"{label}'" for label in labels])
 
                 max_val = max(np.max(np.abs(transformed)) + 1, 2)
                 ax2.set_xlim([0, max_val])
@@ -672,12 +1786,19 @@ class LinearAlgebraVisualizer:
                 ax2.legend()
                 ax2.set_title('Transformed Vectors')
 
+                def describe_3d(i, transformed=transformed, labels=labels):
+                    x, y, z = transformed[i]
+                    return (f"{labels[i]}' = ({x:.4f}, {y:.4f}, {z:.4f})\n"
+                            f"|v| = {np.linalg.norm(transformed[i]):.4f}")
+
+                self._add_tooltip(ax2, transformed, describe_3d)
+
                 plt.tight_layout()
                 plt.show(block=False)
                 plt.pause(0.1)
 
                 # Calculate determinant
-                det = np.linalg.det(transform)
+                det = self.compute.det(transform)
                 print(f"\nDeterminant: {det:.4f}")
                 print(f"Volume scaling factor: {abs(det):.4f}")
 
@@ -695,16 +1816,105 @@ class LinearAlgebraVisualizer:
                 break
             plt.close()
 
+    def visualize_3d_dataset_projection(self):
+        """Project a large N x D dataset to 3D with randomized PCA"""
+        while True:
+            print("\n" + "=" * 50)
+            print("Dataset Projection (top-3 principal components)")
+            print("=" * 50)
+
+            path = input("\nEnter path to .npy file (blank to go back): ").strip()
+            if not path:
+                break
+
+            try:
+                data = load_dataset(path)
+                n, d = data.shape
+                print(f"\nLoaded {n} x {d} matrix, computing top-3 principal axes...")
+                mean, axes, variances, total_variance = randomized_pca(data)
+
+                for i, var in enumerate(variances):
+                    top = np.argsort(np.abs(axes[:, i]))[::-1][:3]
+                    ratio = var / total_variance if total_variance > 0 else 0.0
+                    print(f"PC{i + 1}: variance {var:.4f} ({ratio:.1%} of total), "
+                          f"largest loadings on columns {', '.join(str(j) for j in top)}")
+
+                out_name = input("\nSave all projected points (filename without extension, "
+                                 "blank to skip): ").strip()
+                if out_name:
+                    out = np.lib.format.open_memmap(f"{out_name}.npy", mode='w+',
+                                                    dtype=np.float32, shape=(n, 3))
+                    project_dataset(data, mean, axes, out=out)
+                    out.flush()
+                    print(f"Saved as {out_name}.npy")
+
+                # Only a random sample of rows is projected for plotting
+                rng = np.random.default_rng(0)
+                rows = np.sort(rng.choice(n, size=min(n, MAX_PLOT_POINTS), replace=False))
+                points = project_dataset(data[rows], mean, axes)
+
+                # Create plot
+                fig = plt.figure(figsize=(10, 8))
+                ax = fig.add_subplot(111, projection='3d')
+
+                ax.scatter(points[:, 0], points[:, 1], points[:, 2], s=2, alpha=0.3,
+                           color='gray', label=f'{len(rows)} of {n} points')
+
+                # Principal axes drawn two standard deviations long
+                principal = np.diag(2 * np.sqrt(np.maximum(variances, 0)))
+                self._draw_3d_vectors(ax, principal, ['r', 'g', 'b'],
+                                      [f'PC{i + 1} (2σ = {principal[i, i]:.2f})' for i in range(3)])
+
+                max_val = max(np.max(np.abs(points)), np.max(principal)) + 1
+                ax.set_xlim([-max_val, max_val])
+                ax.set_ylim([-max_val, max_val])
+                ax.set_zlim([-max_val, max_val])
+                ax.set_xlabel('PC1')
+                ax.set_ylabel('PC2')
+                ax.set_zlabel('PC3')
+                ax.legend()
+                ax.set_title(f'Projection of {n} x {d} dataset')
+
+                def describe_point(k, points=points, rows=rows):
+                    p1, p2, p3 = points[k]
+                    return (f"row {rows[k]}\n"
+                            f"PCs = ({p1:.4f}, {p2:.4f}, {p3:.4f})\n"
+                            f"|p| = {np.linalg.norm(points[k]):.4f}")
+
+                self._add_tooltip(ax, points, describe_point)
+
+                plt.tight_layout()
+                plt.show(block=False)
+                plt.pause(0.1)
+
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+                continue
+
+            choice = input("\nOptions:\n1. Load another file\n2. Save image\n0. Back to menu\nChoice: ").strip()
+            if choice == '2':
+                filename = input("Enter filename (without extension): ").strip()
+                plt.savefig(f"{filename}.png", dpi=300, bbox_inches='tight')
+                print(f"Saved as {filename}.png")
+            elif choice != '1':
+                plt.close()
+                break
+            plt.close()
+
     def run(self):
         """Main run loop"""
         print("\n" + "=" * 50)
         print("Interactive Linear Algebra Visualizer")
         print("=" * 50)
 
+        self.compute.autotune()
+        print("\n".join(self.compute.selection_report()))
+
         while True:
             dimension = self.get_dimension_choice()
 
             if dimension is None:
+                print("\n" + "\n".join(self.compute.usage_report()))
                 print("\nThank you for using the visualizer!")
                 break
 
@@ -722,6 +1932,8 @@ class LinearAlgebraVisualizer:
                     self.visualize_2d_system()
                 elif viz_type == '4':
                     self.visualize_2d_transformation()
+                elif viz_type == '5':
+                    self.visualize_2d_line_intersections()
             else:  # 3D
                 if viz_type == '1':
                     self.visualize_3d_vectors()
@@ -731,6 +1943,8 @@ class LinearAlgebraVisualizer:
                     self.visualize_3d_system()
                 elif viz_type == '4':
                     self.visualize_3d_transformation()
+                elif viz_type == '5':
+                    self.visualize_3d_dataset_projection()
 
 
 if __name__ == '__main__':
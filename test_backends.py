@@ -0,0 +1,124 @@
+"""
+Checks that every compute backend and the dispatcher agree with NumPy
+"""
+
+import numpy as np
+import pytest
+
+from main import (BATCH_BUCKETS, KERNEL_DIMS, ComputeDispatcher, NumpyBackend, _is_single,
+                  _sample_arguments, _single_arguments, available_backends, batch_bucket)
+
+KERNEL_CASES = [(kernel, dim) for kernel, dims in KERNEL_DIMS.items() for dim in dims]
+BACKENDS = available_backends()
+REFERENCE = NumpyBackend()
+
+
+def check_result(result, expected):
+    """Compare a kernel result (array, float or (det, solution) pair) with NumPy's"""
+    if isinstance(expected, tuple):
+        for part, expected_part in zip(result, expected):
+            check_result(part, expected_part)
+        return
+    if np.ndim(expected) == 0:
+        assert type(result) is float
+    else:
+        assert isinstance(result, np.ndarray) and result.dtype == np.float64
+    np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda b: b.name)
+@pytest.mark.parametrize('kernel, dim', KERNEL_CASES)
+def test_batched_kernels_match_numpy(backend, kernel, dim):
+    args = _sample_arguments(np.random.default_rng(0), kernel, dim, 50)
+
+    result = getattr(backend, kernel)(*args)
+    expected = getattr(REFERENCE, kernel)(*args)
+
+    if kernel == 'solve':
+        for part, expected_part in zip(result, expected):
+            np.testing.assert_allclose(part, expected_part, rtol=1e-12)
+    else:
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda b: b.name)
+@pytest.mark.parametrize('kernel, dim', KERNEL_CASES)
+def test_single_kernels_match_numpy(backend, kernel, dim):
+    args = _sample_arguments(np.random.default_rng(1), kernel, dim, 1)
+
+    result = getattr(backend, kernel + '_one')(*_single_arguments(kernel, args))
+    expected = getattr(REFERENCE, kernel)(*args)
+    expected = (float(expected[0][0]), expected[1][0]) if kernel == 'solve' else expected[0]
+
+    check_result(result, expected)
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda b: b.name)
+def test_singular_solve_gives_nan(backend):
+    det, solution = backend.solve_one([[1.0, 2.0], [2.0, 4.0]], [1.0, 1.0])
+
+    assert det == 0.0
+    assert np.isnan(solution).all()
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda b: b.name)
+def test_det_falls_back_for_other_sizes(backend):
+    matrices = np.random.default_rng(2).standard_normal((5, 4, 4))
+
+    np.testing.assert_allclose(backend.det(matrices), np.linalg.det(matrices), rtol=1e-12)
+    check_result(backend.det_one(matrices[0].tolist()), float(np.linalg.det(matrices[0])))
+
+
+def test_is_single():
+    assert _is_single([1.0, 2.0], 1)
+    assert not _is_single([[1.0, 2.0]], 1)
+    assert _is_single([[1.0, 2.0], [3.0, 4.0]], 2)
+    assert not _is_single(np.zeros((3, 2, 2)), 2)
+    assert _is_single(np.zeros(3), 1)
+
+
+def test_batch_bucket():
+    assert [batch_bucket(n) for n in (1, 2, 16, 17, 256, 257, 10**6)] == \
+        [1, 16, 16, 256, 256, 4096, BATCH_BUCKETS[-1]]
+
+
+@pytest.mark.parametrize('backend', BACKENDS, ids=lambda b: b.name)
+def test_dispatcher_accepts_lists_and_arrays(backend):
+    compute = ComputeDispatcher()
+    # Route every kernel, dimension and bucket to one backend
+    compute.choices = {(kernel, dim, bucket): backend
+                       for kernel, dim in KERNEL_CASES for bucket in BATCH_BUCKETS}
+    u, v = [1.0, 2.0, 3.0], [4.0, 5.0, 6.0]
+    matrix = [[2.0, 0.0, 1.0], [0.0, 1.0, 0.0], [1.0, 0.0, 3.0]]
+
+    for first, second in ((u, v), (np.array(u), np.array(v))):
+        check_result(compute.cross(first, second), np.cross(u, v))
+        check_result(compute.dot(first, second), 32.0)
+        check_result(compute.transform(first, matrix), np.array(matrix) @ u)
+    check_result(compute.det(matrix), 5.0)
+    check_result(compute.solve([[1.0, 1.0], [1.0, -1.0]], [3.0, 1.0]), (-2.0, np.array([2.0, 1.0])))
+
+    batch = np.array([u, v, u])
+    np.testing.assert_allclose(compute.cross(batch.tolist(), batch[::-1]), np.cross(batch, batch[::-1]))
+    np.testing.assert_allclose(compute.transform(batch, matrix), batch @ np.array(matrix).T)
+
+    assert {name for (_, _, _, name) in compute.usage} == {backend.name}
+    assert ('cross', 3, 1, backend.name) in compute.usage
+    assert ('cross', 3, 16, backend.name) in compute.usage
+
+
+def test_dispatcher_det_of_4x4():
+    compute = ComputeDispatcher()
+    compute.autotune(repeats=1)
+    matrix = np.random.default_rng(3).standard_normal((4, 4))
+
+    check_result(compute.det(matrix.tolist()), float(np.linalg.det(matrix)))
+    np.testing.assert_allclose(compute.det(np.stack([matrix] * 20)), np.linalg.det(matrix), rtol=1e-12)
+
+
+def test_autotune_picks_every_bucket():
+    compute = ComputeDispatcher()
+    compute.autotune(repeats=1)
+
+    assert set(compute.choices) == {(kernel, dim, bucket)
+                                    for kernel, dim in KERNEL_CASES for bucket in BATCH_BUCKETS}
@@ -0,0 +1,91 @@
+"""
+Checks GridIndex.nearest against a brute-force search
+"""
+
+import numpy as np
+import pytest
+
+from main import GridIndex
+
+
+def brute_force(points, x, y, max_dist=np.inf):
+    """Distance to the nearest point within max_dist, or None"""
+    distances = np.hypot(points[:, 0] - x, points[:, 1] - y)
+    best = distances.min()
+    return best if best <= max_dist else None
+
+
+def check_queries(points, queries, max_dist=np.inf):
+    index = GridIndex(points)
+    for x, y in queries:
+        hit = index.nearest(x, y, max_dist)
+        expected = brute_force(points, x, y, max_dist)
+        if expected is None:
+            assert hit is None
+        else:
+            # Ties may pick any of the equally near points, so compare distances
+            assert hit is not None
+            assert np.hypot(points[hit, 0] - x, points[hit, 1] - y) == pytest.approx(expected, abs=1e-12)
+
+
+def make_points(kind, n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    if kind == 'uniform':
+        return rng.uniform([0, 0], [800, 600], (n, 2))
+    if kind == 'clustered':
+        # Most points in one tight blob, enough to give it nested grids
+        blob = rng.normal([400, 300], 2.0, (n - n // 20, 2))
+        return np.vstack([blob, rng.uniform([0, 0], [800, 600], (n // 20, 2))])
+    if kind == 'collinear':
+        return np.column_stack([rng.uniform(0, 800, n), np.full(n, 300.0)])
+    if kind == 'diagonal':
+        t = rng.uniform(0, 500, n)
+        return np.column_stack([t, 0.5 * t + 20])
+    if kind == 'duplicates':
+        return np.full((n, 2), 123.5)
+    if kind == 'single':
+        return np.array([[10.0, -4.0]])
+    raise ValueError(kind)
+
+
+KINDS = ['uniform', 'clustered', 'collinear', 'diagonal', 'duplicates', 'single']
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_nearest_matches_brute_force(kind):
+    points = make_points(kind)
+    rng = np.random.default_rng(1)
+    queries = np.vstack([rng.uniform([0, 0], [800, 600], (200, 2)),
+                         points[rng.integers(len(points), size=50)] + rng.normal(0, 0.5, (50, 2))])
+
+    check_queries(points, queries)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_queries_outside_the_grid(kind):
+    points = make_points(kind)
+    queries = [(-500, -500), (2000, 300), (400, -1000), (400, 5000), (-1e6, 1e6), (123.5, 123.5)]
+
+    check_queries(points, queries)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_max_dist_cutoff(kind):
+    points = make_points(kind)
+    rng = np.random.default_rng(2)
+    queries = rng.uniform([-50, -50], [850, 650], (200, 2))
+
+    check_queries(points, queries, max_dist=15)
+    check_queries(points, queries, max_dist=0.5)
+
+
+def test_nested_grids_are_used_for_dense_cells():
+    points = make_points('clustered')
+
+    index = GridIndex(points)
+
+    assert index._dense_rows
+
+
+def test_empty_index():
+    assert GridIndex(np.empty((0, 2))).nearest(0.0, 0.0) is None
@@ -0,0 +1,74 @@
+"""
+Checks that the blocked and sweep intersection finders agree
+"""
+
+import numpy as np
+import pytest
+
+from main import ComputeDispatcher, pairwise_intersections, viewport_intersections
+
+BOUNDS = (-10, 10, -10, 10)
+
+# Axis lines, diagonals through the corners and lines lying on the edges
+EDGE_LINES = np.array([[1, 0, 0], [0, 1, 0], [1, 1, 0], [1, -1, 0],
+                       [1, 0, 5], [0, 1, -5], [1, 0, 10], [0, 1, 10]], dtype=float)
+
+
+def random_lines(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lines = rng.standard_normal((n, 3))
+    lines[:, 2] *= 20
+    return lines
+
+
+def pair_set(pairs):
+    return set(map(tuple, pairs.tolist()))
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_blocked_and_sweep_agree_on_random_lines(seed):
+    lines = random_lines(700, seed)
+
+    points, pairs = pairwise_intersections(lines, BOUNDS, tile=64)
+    sweep_points, sweep_pairs = viewport_intersections(lines, BOUNDS)
+
+    assert pair_set(pairs) == pair_set(sweep_pairs)
+    order = np.lexsort(pairs.T[::-1])
+    sweep_order = np.lexsort(sweep_pairs.T[::-1])
+    np.testing.assert_allclose(sweep_points[sweep_order], points[order], atol=1e-9)
+
+
+def test_edges_and_corners_count_as_inside():
+    _, pairs = pairwise_intersections(EDGE_LINES, BOUNDS)
+    _, sweep_pairs = viewport_intersections(EDGE_LINES, BOUNDS)
+
+    assert len(pairs) == 22
+    assert pair_set(pairs) == pair_set(sweep_pairs)
+    assert {(2, 6), (3, 7), (6, 7)} <= pair_set(sweep_pairs)
+
+
+def test_sweep_solves_through_dispatcher():
+    compute = ComputeDispatcher()
+
+    viewport_intersections(random_lines(200), BOUNDS, compute)
+
+    assert any(key[0] == 'solve' for key in compute.usage)
+
+
+def test_whole_plane_returns_every_pair():
+    lines = random_lines(300)
+
+    _, pairs = pairwise_intersections(lines, tile=64)
+
+    assert len(pairs) == 300 * 299 // 2
+
+
+def test_sweep_drops_touching_chords_that_cross_outside():
+    # Nearly parallel chords whose ends touch within the edge tolerance meet at (-24, 0)
+    lines = np.array([[0, 1, 0], [-5e-10, 1, 1.2e-8]])
+
+    points, _ = pairwise_intersections(lines, BOUNDS)
+    sweep_points, _ = viewport_intersections(lines, BOUNDS)
+
+    assert len(points) == 0
+    assert len(sweep_points) == 0
@@ -0,0 +1,81 @@
+"""
+Checks for the streaming randomized PCA used by the dataset projection view
+"""
+
+import numpy as np
+import pytest
+
+from main import load_dataset, project_dataset, randomized_pca
+
+
+def make_dataset(offset=0.0, n=5000, d=40, seed=0):
+    """Low-rank data with a clear top-3 spectrum plus small isotropic noise"""
+    rng = np.random.default_rng(seed)
+    basis = np.linalg.qr(rng.standard_normal((d, 3)))[0]
+    signal = rng.standard_normal((n, 3)) * [10.0, 5.0, 2.0]
+    return signal @ basis.T + 0.1 * rng.standard_normal((n, d)) + offset
+
+
+def exact_pca(X):
+    cov = np.cov(X, rowvar=False)
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    return eigvals[::-1][:3], eigvecs[:, ::-1][:, :3], np.trace(cov)
+
+
+@pytest.mark.parametrize('offset', [0.0, 1e8])
+def test_randomized_pca_matches_eigh(offset):
+    X = make_dataset(offset)
+    expected_vars, expected_axes, expected_total = exact_pca(X)
+
+    # chunk_rows smaller than N exercises the streaming accumulation
+    mean, axes, variances, total_variance = randomized_pca(X, chunk_rows=700)
+
+    np.testing.assert_allclose(mean, X.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(variances, expected_vars, rtol=1e-6)
+    np.testing.assert_allclose(total_variance, expected_total, rtol=1e-6)
+    # Axes are unique up to sign
+    np.testing.assert_allclose(np.abs(np.sum(axes * expected_axes, axis=0)), 1.0, atol=1e-6)
+
+
+def test_offset_does_not_change_result():
+    _, axes, variances, total_variance = randomized_pca(make_dataset(), chunk_rows=700)
+    _, axes_off, variances_off, total_off = randomized_pca(make_dataset(1e8), chunk_rows=700)
+
+    np.testing.assert_allclose(variances_off, variances, rtol=1e-6)
+    np.testing.assert_allclose(total_off, total_variance, rtol=1e-6)
+    np.testing.assert_allclose(np.abs(np.sum(axes * axes_off, axis=0)), 1.0, atol=1e-6)
+
+
+def test_project_dataset_streams_in_chunks():
+    X = make_dataset(1e8)
+    mean, axes, _, _ = randomized_pca(X, chunk_rows=700)
+
+    projected = project_dataset(X, mean, axes, chunk_rows=333)
+
+    np.testing.assert_allclose(projected, (X - mean) @ axes, atol=1e-6)
+
+
+def test_load_dataset_memory_maps_npy(tmp_path):
+    path = tmp_path / 'data.npy'
+    np.save(path, make_dataset(n=50, d=5))
+
+    data = load_dataset(str(path))
+
+    assert isinstance(data, np.memmap)
+    assert data.shape == (50, 5)
+
+
+def test_load_dataset_rejects_npz(tmp_path):
+    path = tmp_path / 'data.npz'
+    np.savez(path, data=make_dataset(n=50, d=5))
+
+    with pytest.raises(ValueError):
+        load_dataset(str(path))
+
+
+def test_load_dataset_rejects_too_few_columns(tmp_path):
+    path = tmp_path / 'data.npy'
+    np.save(path, np.zeros((10, 2)))
+
+    with pytest.raises(ValueError):
+        load_dataset(str(path))